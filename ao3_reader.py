@@ -5,21 +5,94 @@ With pager support, customizable columns, and proper paragraph formatting
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+import lxml.html
 import time
 import sys
 import argparse
 from urllib.parse import urljoin, quote
+from html import unescape
+from collections import namedtuple
 import textwrap
 import os
 import subprocess
-import tempfile
+import shutil
+from concurrent.futures import Future
+import threading
 import re
+import hashlib
+import shelve
+
+def _has_class(name):
+    """XPath predicate matching one token of a space-separated class attribute"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def _in_background(fn, *args):
+    """Run fn(*args) on a daemon thread and return a Future for the result.
+    
+    Unlike executor workers, daemon threads don't hold up interpreter exit,
+    so a prefetch still in flight never delays quitting.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+# One search result
+Work = namedtuple('Work', 'title authors fandoms rating warnings kudos words chapters hits summary tags url')
+
+# Blank-line paragraph separator in chapter text
+_PARA_RE = re.compile(r'\n\s*\n')
+
+# Parsed search pages are cached on disk for a short while
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'ao3-reader', 'pages.db')
+CACHE_TTL = 900  # seconds
+
+# Text that marks AO3's age verification page
+_ADULT_MARKER = b"This work could have adult content"
+
+# First <form> tag on a page and its action attribute, if any
+_FORM_ACTION_RE = re.compile(rb'<form\b[^>]*?(?:\saction\s*=\s*["\']([^"\']*)["\'][^>]*)?>', re.I)
 
 class AO3Reader:
+    # Compiled XPath queries for search result blurbs
+    _XP_WORK = etree.XPath(f".//li[{_has_class('work')}]")
+    _XP_HEADING = etree.XPath(f".//h4[{_has_class('heading')}]")
+    _XP_TITLE = etree.XPath("(.//a)[1]")
+    _XP_AUTHORS = etree.XPath(".//a[@rel='author']")
+    _XP_FANDOMS = etree.XPath(f"(.//h5[{_has_class('fandoms')}])[1]//a")
+    _XP_RATING = etree.XPath(f"string((.//ul[{_has_class('required-tags')}])[1]//span[{_has_class('rating')}]/@title)")
+    _XP_WARNINGS = etree.XPath(f"(.//ul[{_has_class('required-tags')}])[1]//span[{_has_class('warnings')}]/@title")
+    _XP_STATS = etree.XPath(f"(.//dl[{_has_class('stats')}])[1]//dd[@class]")
+    _XP_SUMMARY = etree.XPath(f".//blockquote[{_has_class('userstuff')}]")
+    _XP_TAGS = etree.XPath(f"(.//ul[{_has_class('tags')}])[1]//a[{_has_class('tag')}]")
+    
+    # Compiled XPath queries for work pages
+    _XP_WORK_TITLE = etree.XPath(f"(//h2[{_has_class('title')}])[1]")
+    _XP_WORK_AUTHOR = etree.XPath("(//a[@rel='author'])[1]")
+    _XP_CHAPTER_NAV = etree.XPath(f"(//ol[{_has_class('chapter')}])[1]")
+    _XP_CHAPTER_ITEMS = etree.XPath(".//li")
+    _XP_CHAPTER_LINK = etree.XPath("(.//a[@href])[1]")
+    _XP_CHAPTER_CONTENT = etree.XPath(f"(//div[{_has_class('userstuff')}])[1]")
+    _XP_GATE_FORM = etree.XPath("(//form)[1]")
+    
     def __init__(self, columns=None):
         self.base_url = "https://archiveofourown.org"
         self.session = requests.Session()
+        # Keep a small keep-alive pool to AO3 and retry transient failures
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -34,33 +107,90 @@ class AO3Reader:
                 self.terminal_width = os.get_terminal_size().columns
             except:
                 self.terminal_width = 80
+        
+        # Separator lines, built once for the terminal width
+        self._eq_sep = '=' * self.terminal_width
+        self._dash_sep = '-' * self.terminal_width
+        self._short_dash = '-' * 40
+        
+        # Reusable wrappers for chapter paragraphs and search summaries
+        self._body_wrapper = textwrap.TextWrapper(width=self.terminal_width-4)
+        self._summary_wrapper = textwrap.TextWrapper(width=self.terminal_width-6,
+                                                     initial_indent='   📖 ', subsequent_indent='      ')
+        
+        # Look up the system pager once: less first (best experience), then more
+        if shutil.which('less'):
+            self._pager_cmd = ['less', '-R', '-S', '-F', '-X']
+        elif shutil.which('more'):
+            self._pager_cmd = ['more']
+        else:
+            self._pager_cmd = None
+        
+        # Background fetch of an upcoming chapter, keyed by (work URL, chapter)
+        self._prefetch = {}
     
-    def verify_adult_content(self, url):
-        """Handle age verification if needed"""
+    def parse_streamed(self, response):
+        """Feed a response into lxml chunk by chunk; return (tree, is_age_gate)"""
+        # Trust the header charset only if one was sent; otherwise let lxml read <meta>
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset' in content_type else None
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        gated = False
+        tail = b''
+        
+        for chunk in response.iter_content(64 * 1024):
+            if not gated:
+                # Look for the marker in this chunk and across the previous boundary
+                gated = _ADULT_MARKER in chunk or _ADULT_MARKER in tail + chunk[:len(_ADULT_MARKER)]
+                tail = (tail + chunk[-len(_ADULT_MARKER):])[-len(_ADULT_MARKER):]
+            parser.feed(chunk)
+        
+        return parser.close(), gated
+    
+    def verify_adult_content(self, url, response=None):
+        """Handle age verification if needed
+        
+        response, if given, is an already downloaded page for url that is
+        checked instead of fetching it again.
+        """
         try:
-            response = self.session.get(url)
+            if response is None:
+                response = self.session.get(url)
             
-            # Check if we hit age verification page
-            if "This work could have adult content" in response.text:
+            # Check if we hit age verification page, on the raw bytes so
+            # ordinary work pages are never decoded here
+            body = response.content
+            if _ADULT_MARKER in body:
                 # Find the form and submit it
-                soup = BeautifulSoup(response.text, 'html.parser')
-                form = soup.find('form')
+                form = _FORM_ACTION_RE.search(body)
                 if form:
-                    form_url = urljoin(url, form.get('action', ''))
-                    # Submit age verification
-                    verify_data = {'view_adult': 'true'}
-                    response = self.session.post(form_url, data=verify_data)
-                    
-                    # Try the original URL again
-                    response = self.session.get(url)
+                    action = unescape(form.group(1).decode()) if form.group(1) else ''
+                    response = self.pass_age_gate(url, action)
             
             return response
         except requests.RequestException as e:
             print(f"Error accessing content: {e}")
             return None
     
+    def pass_age_gate(self, url, action):
+        """Submit the age verification form at action, then fetch url again"""
+        # Submit age verification
+        verify_data = {'view_adult': 'true'}
+        self.session.post(urljoin(url, action), data=verify_data)
+        
+        # Try the original URL again
+        return self.session.get(url)
+    
     def search_fics(self, query, sort="kudos", page=1, rating=None):
         """Search for fanfiction on AO3 with better filtering"""
+        try:
+            return self.fetch_search_page(query, sort, page, rating)
+        except requests.RequestException as e:
+            print(f"Error fetching search results: {e}")
+            return []
+    
+    def fetch_search_page(self, query, sort="kudos", page=1, rating=None):
+        """Fetch and parse one page of search results, raising on network errors"""
         search_url = f"{self.base_url}/works/search"
         params = {
             'work_search[query]': query,
@@ -73,143 +203,196 @@ class AO3Reader:
         if rating:
             params['work_search[rating_ids][]'] = rating
         
+        # Serve recently fetched pages from the disk cache
+        cache_key = hashlib.blake2b(repr((query, sort, page, rating)).encode()).hexdigest()
+        works = self._cache_get(cache_key)
+        if works is not None:
+            return works
+        
+        response = self.session.get(search_url, params=params)
+        response.raise_for_status()
+        works = self.parse_search_results(response.content)
+        
+        if works:
+            self._cache_put(cache_key, works)
+        return works
+    
+    def _cache_get(self, key):
+        """Return cached works for key if present and not expired"""
+        try:
+            with shelve.open(CACHE_PATH, flag='r') as cache:
+                stored_at, fields, columns = cache[key]
+        except Exception:
+            return None
+        
+        if fields != Work._fields or time.time() - stored_at > CACHE_TTL:
+            return None
+        return [Work(*row) for row in zip(*columns)]
+    
+    def _cache_put(self, key, works):
+        """Store works in the disk cache, pruning expired entries; cache errors are ignored"""
+        now = time.time()
         try:
-            response = self.session.get(search_url, params=params)
-            response.raise_for_status()
-            return self.parse_search_results(response.text)
-        except requests.RequestException as e:
-            print(f"Error fetching search results: {e}")
-            return []
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            live = {}
+            stale = False
+            with shelve.open(CACHE_PATH) as cache:
+                for cached_key in list(cache.keys()):
+                    try:
+                        entry = cache[cached_key]
+                        fresh = now - entry[0] <= CACHE_TTL
+                    except Exception:
+                        fresh = False
+                    if fresh:
+                        live[cached_key] = entry
+                    else:
+                        stale = True
+            
+            # Rewrite the database without expired entries so its files shrink too
+            with shelve.open(CACHE_PATH, flag='n' if stale else 'c') as cache:
+                if stale:
+                    cache.update(live)
+                # Store column lists rather than Work objects: denser, and
+                # independent of the module Work was pickled from
+                cache[key] = (now, Work._fields, list(zip(*works)))
+        except Exception:
+            pass
     
     def parse_search_results(self, html):
         """Parse search results from AO3 HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            tree = lxml.html.fromstring(html)
+        except etree.ParserError:
+            # Empty or whitespace-only body: no results
+            return []
         works = []
         
-        work_items = soup.find_all('li', class_='work')
-        
-        for item in work_items:
+        for item in self._XP_WORK(tree):
             try:
                 # Extract work information
-                heading = item.find('h4', class_='heading')
+                heading = self._XP_HEADING(item)
                 if not heading:
                     continue
+                heading = heading[0]
                 
-                title_link = heading.find('a')
-                title = title_link.get_text().strip() if title_link else "Unknown Title"
-                work_url = urljoin(self.base_url, title_link['href']) if title_link else ""
+                title_link = self._XP_TITLE(heading)
+                title_link = title_link[0] if title_link else None
+                title = title_link.text_content().strip() if title_link is not None else "Unknown Title"
+                work_url = urljoin(self.base_url, title_link.attrib['href']) if title_link is not None else ""
                 
                 # Author
-                author_links = heading.find_all('a', rel='author')
-                authors = [a.get_text().strip() for a in author_links] if author_links else ["Unknown Author"]
+                author_links = self._XP_AUTHORS(heading)
+                authors = [a.text_content().strip() for a in author_links] if author_links else ["Unknown Author"]
                 
                 # Fandoms
-                fandom_tags = item.find('h5', class_='fandoms')
-                fandoms = [a.get_text().strip() for a in fandom_tags.find_all('a')] if fandom_tags else []
+                fandoms = [a.text_content().strip() for a in self._XP_FANDOMS(item)]
                 
                 # Rating and warnings
-                required_tags = item.find('ul', class_='required-tags')
-                rating = "Not Rated"
-                warnings = []
-                if required_tags:
-                    rating_span = required_tags.find('span', class_='rating')
-                    if rating_span:
-                        rating = rating_span.get('title', 'Not Rated')
-                    
-                    warning_spans = required_tags.find_all('span', class_='warnings')
-                    warnings = [w.get('title', '') for w in warning_spans if w.get('title')]
+                rating = self._XP_RATING(item) or "Not Rated"
+                warnings = [w for w in self._XP_WARNINGS(item) if w]
                 
-                # Stats
-                stats = item.find('dl', class_='stats')
-                kudos = words = chapters = hits = "N/A"
-                if stats:
-                    kudos_dd = stats.find('dd', class_='kudos')
-                    kudos = kudos_dd.get_text().strip() if kudos_dd else "N/A"
-                    
-                    words_dd = stats.find('dd', class_='words')
-                    words = words_dd.get_text().strip() if words_dd else "N/A"
-                    
-                    chapters_dd = stats.find('dd', class_='chapters')
-                    chapters = chapters_dd.get_text().strip() if chapters_dd else "N/A"
-                    
-                    hits_dd = stats.find('dd', class_='hits')
-                    hits = hits_dd.get_text().strip() if hits_dd else "N/A"
+                # Stats, collected in one pass keyed by each <dd>'s class
+                stats = {}
+                for dd in self._XP_STATS(item):
+                    cls = dd.get('class').split()
+                    if cls:
+                        stats.setdefault(cls[0], dd.text_content().strip())
+                kudos = stats.get('kudos') or "N/A"
+                words = stats.get('words') or "N/A"
+                chapters = stats.get('chapters') or "N/A"
+                hits = stats.get('hits') or "N/A"
                 
                 # Summary
-                summary_block = item.find('blockquote', class_='userstuff')
-                summary = summary_block.get_text().strip()[:150] + "..." if summary_block else ""
+                summary_block = self._XP_SUMMARY(item)
+                summary = self._summary_text(summary_block[0]) if summary_block else ""
                 
                 # Tags
-                tag_list = item.find('ul', class_='tags')
-                tags = []
-                if tag_list:
-                    tag_links = tag_list.find_all('a', class_='tag')
-                    tags = [tag.get_text().strip() for tag in tag_links[:5]]  # Limit to 5 tags
+                tag_links = self._XP_TAGS(item)
+                tags = [tag.text_content().strip() for tag in tag_links[:5]]  # Limit to 5 tags
                 
-                works.append({
-                    'title': title,
-                    'authors': authors,
-                    'fandoms': fandoms,
-                    'rating': rating,
-                    'warnings': warnings,
-                    'kudos': kudos,
-                    'words': words,
-                    'chapters': chapters,
-                    'hits': hits,
-                    'summary': summary,
-                    'tags': tags,
-                    'url': work_url
-                })
+                works.append(Work(
+                    title=title,
+                    authors=authors,
+                    fandoms=fandoms,
+                    rating=rating,
+                    warnings=warnings,
+                    kudos=kudos,
+                    words=words,
+                    chapters=chapters,
+                    hits=hits,
+                    summary=summary,
+                    tags=tags,
+                    url=work_url
+                ))
             except Exception as e:
                 continue
         
         return works
     
+    def _summary_text(self, block, limit=150):
+        """Join the stripped text pieces of a summary, stopping once past limit"""
+        parts = []
+        length = 0
+        for piece in block.itertext():
+            piece = piece.strip()
+            if not piece:
+                continue
+            length += len(piece) + (1 if parts else 0)
+            parts.append(piece)
+            if length > limit:
+                break
+        
+        raw = ' '.join(parts)
+        return raw[:limit] + "..." if len(raw) > limit else raw
+    
     def display_works(self, works):
         """Display works in a clean, readable format"""
         if not works:
             print("No works found.")
             return
         
-        separator = "=" * self.terminal_width
+        separator = self._eq_sep
+        out = []
         
-        print(f"\n{separator}")
-        print(f"Found {len(works)} works:")
-        print(f"{separator}")
+        out.append(f"\n{separator}")
+        out.append(f"Found {len(works)} works:")
+        out.append(f"{separator}")
         
         for i, work in enumerate(works, 1):
-            print(f"\n{i}. {work['title']}")
-            print(f"   By: {', '.join(work['authors'])}")
+            out.append(f"\n{i}. {work.title}")
+            out.append(f"   By: {', '.join(work.authors)}")
             
-            if work['fandoms']:
-                fandoms_text = ', '.join(work['fandoms'][:2])  # Limit fandoms display
-                if len(work['fandoms']) > 2:
-                    fandoms_text += f" (+{len(work['fandoms'])-2} more)"
-                print(f"   Fandom: {fandoms_text}")
+            if work.fandoms:
+                fandoms_text = ', '.join(work.fandoms[:2])  # Limit fandoms display
+                if len(work.fandoms) > 2:
+                    fandoms_text += f" (+{len(work.fandoms)-2} more)"
+                out.append(f"   Fandom: {fandoms_text}")
             
-            print(f"   Rating: {work['rating']}")
-            if work['warnings']:
-                print(f"   Warnings: {', '.join(work['warnings'])}")
+            out.append(f"   Rating: {work.rating}")
+            if work.warnings:
+                out.append(f"   Warnings: {', '.join(work.warnings)}")
             
-            stats_line = f"   📊 {work['kudos']} kudos | {work['words']} words | {work['chapters']} chapters | {work['hits']} hits"
-            print(stats_line)
+            stats_line = f"   📊 {work.kudos} kudos | {work.words} words | {work.chapters} chapters | {work.hits} hits"
+            out.append(stats_line)
             
-            if work['tags']:
-                tags_text = ', '.join(work['tags'])
-                print(f"   Tags: {tags_text}")
+            if work.tags:
+                tags_text = ', '.join(work.tags)
+                out.append(f"   Tags: {tags_text}")
             
-            if work['summary']:
+            if work.summary:
                 # Wrap summary text nicely using full terminal width
-                summary_wrapped = textwrap.fill(work['summary'], width=self.terminal_width-6, 
-                                              initial_indent='   📖 ', subsequent_indent='      ')
-                print(summary_wrapped)
+                summary_wrapped = self._summary_wrapper.fill(work.summary)
+                out.append(summary_wrapped)
             
-            print(f"   🔗 {work['url']}")
-            print(f"   {'-'*self.terminal_width}")
+            out.append(f"   🔗 {work.url}")
+            out.append(f"   {self._dash_sep}")
+        
+        # One write for the whole page instead of a print per line
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def format_content_for_pager(self, title, author, chapter_text, chapter=1, total_chapters=1):
         """Format content with proper paragraph handling and line breaks"""
-        separator = "=" * self.terminal_width
+        separator = self._eq_sep
         
         # Header
         formatted_text = f"{separator}\n"
@@ -222,7 +405,7 @@ class AO3Reader:
         # Process content with proper paragraph breaks
         if chapter_text:
             # Split by multiple line breaks to preserve paragraph structure
-            paragraphs = re.split(r'\n\s*\n', chapter_text.strip())
+            paragraphs = _PARA_RE.split(chapter_text.strip())
             
             for paragraph in paragraphs:
                 if paragraph.strip():
@@ -231,7 +414,7 @@ class AO3Reader:
                     paragraph_text = ' '.join(lines)
                     
                     # Wrap the paragraph using full terminal width with some padding
-                    wrapped = textwrap.fill(paragraph_text, width=self.terminal_width-4)
+                    wrapped = self._body_wrapper.fill(paragraph_text)
                     formatted_text += wrapped + "\n\n"
         
         # Footer with navigation info
@@ -248,30 +431,13 @@ class AO3Reader:
     def use_pager(self, text):
         """Display text using system pager (like less) with arrow key navigation"""
         try:
-            # Try to use less first (best experience)
-            pager_cmd = None
-            
-            # Check for less
-            if subprocess.run(['which', 'less'], capture_output=True).returncode == 0:
-                pager_cmd = ['less', '-R', '-S', '-F', '-X']
-            # Check for more
-            elif subprocess.run(['which', 'more'], capture_output=True).returncode == 0:
-                pager_cmd = ['more']
-            # Check for cat with paging (fallback)
-            else:
+            if self._pager_cmd is None:
                 # Fallback: just print with manual paging
                 self.manual_pager(text)
                 return
             
-            # Use system pager
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-                tmp_file.write(text)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                subprocess.run(pager_cmd + [tmp_file_path])
-            finally:
-                os.unlink(tmp_file_path)
+            # Use system pager, feeding the text through its stdin
+            subprocess.run(self._pager_cmd, input=text.encode('utf-8'))
                 
         except Exception as e:
             print(f"Error using pager: {e}")
@@ -292,8 +458,7 @@ class AO3Reader:
         while current_line < len(lines):
             # Display current page
             end_line = min(current_line + terminal_height, len(lines))
-            for i in range(current_line, end_line):
-                print(lines[i])
+            sys.stdout.write('\n'.join(lines[current_line:end_line]) + '\n')
             
             if end_line >= len(lines):
                 print("\n[End of content - Press 'q' to quit]")
@@ -312,53 +477,135 @@ class AO3Reader:
             except KeyboardInterrupt:
                 break
     
-    def read_work(self, work_url, chapter=1, use_pager=True):
-        """Read a work with full adult content support and pager"""
-        try:
-            # Handle potential age verification
-            response = self.verify_adult_content(work_url)
+    def extract_chapter_text(self, chapter_content):
+        """Flatten chapter HTML to text in one pass, preserving paragraph structure"""
+        parts = []
+        walker = etree.iterwalk(chapter_content, events=('start', 'end', 'comment', 'pi'))
+        
+        for event, elem in walker:
+            if event == 'start':
+                # Drop scripts and styles entirely
+                if elem.tag in ('script', 'style'):
+                    walker.skip_subtree()
+                # <br> becomes a newline, <hr> a separator line
+                elif elem.tag == 'br':
+                    parts.append('\n')
+                    walker.skip_subtree()
+                elif elem.tag == 'hr':
+                    parts.append('\n' + self._short_dash + '\n')
+                    walker.skip_subtree()
+                elif elem.text:
+                    parts.append(elem.text)
+                continue
+            
+            # Double newline after each <p> to preserve paragraphs
+            if event == 'end' and elem.tag == 'p':
+                parts.append('\n\n')
+            # Text following an element (or comment) belongs to its parent
+            if elem.tail and elem is not chapter_content:
+                parts.append(elem.tail)
+        
+        return ''.join(parts)
+    
+    def fetch_work_page(self, url, response=None):
+        """Fetch (unless a response is given) and parse a work page
+        
+        Returns the parsed tree, or None if AO3 answered with an error status.
+        Network errors are raised as requests.RequestException.
+        """
+        if response is not None:
+            # Already downloaded (prefetched): check the raw bytes for the age gate
+            response = self.verify_adult_content(url, response)
             if not response:
-                return
+                return None
+            return self.parse_streamed(response)[0]
+        
+        # Stream the page straight into the parser
+        response = self.session.get(url, stream=True)
+        if not response:
+            return None
+        tree, gated = self.parse_streamed(response)
+        
+        # Age gate: submit its form straight away rather than fetching it again
+        if gated:
+            form = self._XP_GATE_FORM(tree)
+            if form:
+                response = self.pass_age_gate(url, form[0].get('action', ''))
+                if not response:
+                    return None
+                tree, _ = self.parse_streamed(response)
+        return tree
+    
+    def chapter_url(self, tree, work_url, chapter):
+        """URL of a chapter taken from a work page's chapter index, or None"""
+        chapter_nav = self._XP_CHAPTER_NAV(tree)
+        if not chapter_nav:
+            return None
+        chapters = self._XP_CHAPTER_ITEMS(chapter_nav[0])
+        if not 1 <= chapter <= len(chapters):
+            return None
+        link = self._XP_CHAPTER_LINK(chapters[chapter - 1])
+        return urljoin(work_url, link[0].get('href')) if link else None
+    
+    def read_work(self, work_url, chapter=1, use_pager=True, prefetch_next=False):
+        """Read a work with full adult content support and pager
+        
+        Returns the number of the next chapter, or None if there is none.
+        With prefetch_next, that chapter is fetched in the background while
+        this one is displayed.
+        """
+        try:
+            # Use a prefetched chapter page if one is waiting
+            tree = None
+            prefetched = self._prefetch.pop((work_url, chapter), None)
+            self._prefetch.clear()
+            if prefetched is not None:
+                chapter_url, future = prefetched
+                try:
+                    tree = self.fetch_work_page(chapter_url, future.result())
+                except requests.RequestException:
+                    tree = None
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if tree is None:
+                tree = self.fetch_work_page(work_url)
+                if tree is None:
+                    return None
+                
+                # The work URL opens on chapter 1; follow the index to the one asked for
+                if chapter > 1:
+                    chapter_url = self.chapter_url(tree, work_url, chapter)
+                    if chapter_url:
+                        tree = self.fetch_work_page(chapter_url)
+                        if tree is None:
+                            return None
             
             # Work metadata
-            title_elem = soup.find('h2', class_='title')
-            title = title_elem.get_text().strip() if title_elem else "Unknown Title"
+            title_elem = self._XP_WORK_TITLE(tree)
+            title = title_elem[0].text_content().strip() if title_elem else "Unknown Title"
             
-            author_elem = soup.find('a', rel='author')
-            author = author_elem.get_text().strip() if author_elem else "Unknown Author"
+            author_elem = self._XP_WORK_AUTHOR(tree)
+            author = author_elem[0].text_content().strip() if author_elem else "Unknown Author"
             
             # Chapter navigation
-            chapter_nav = soup.find('ol', class_='chapter')
+            chapter_nav = self._XP_CHAPTER_NAV(tree)
             total_chapters = 1
             if chapter_nav:
-                chapters = chapter_nav.find_all('li')
-                total_chapters = len(chapters)
+                total_chapters = len(self._XP_CHAPTER_ITEMS(chapter_nav[0]))
+            next_chapter = chapter + 1 if chapter < total_chapters else None
+            
+            # Start fetching the next chapter while this one is displayed
+            if prefetch_next and next_chapter:
+                next_url = self.chapter_url(tree, work_url, next_chapter)
+                if next_url:
+                    future = _in_background(self.session.get, next_url)
+                    self._prefetch[(work_url, next_chapter)] = (next_url, future)
             
             # Chapter content
-            chapter_content = soup.find('div', class_='userstuff')
+            chapter_content = self._XP_CHAPTER_CONTENT(tree)
             chapter_text = ""
             
             if chapter_content:
-                # Clean up the content but preserve structure
-                for elem in chapter_content(['script', 'style']):
-                    elem.decompose()
-                
-                # Get text with better formatting
-                # Replace <p> tags with double newlines to preserve paragraphs
-                for p in chapter_content.find_all('p'):
-                    p.insert_after('\n\n')
-                
-                # Replace <br> tags with newlines
-                for br in chapter_content.find_all('br'):
-                    br.replace_with('\n')
-                
-                # Replace <hr> tags with separator
-                for hr in chapter_content.find_all('hr'):
-                    hr.replace_with('\n' + '-' * 40 + '\n')
-                
-                chapter_text = chapter_content.get_text()
+                chapter_text = self.extract_chapter_text(chapter_content[0])
             
             # Format content for display
             formatted_content = self.format_content_for_pager(
@@ -369,7 +616,11 @@ class AO3Reader:
                 self.use_pager(formatted_content)
             else:
                 print(formatted_content)
+            
+            return next_chapter
                 
+        except requests.RequestException as e:
+            print(f"Error accessing content: {e}")
         except Exception as e:
             print(f"Error reading work: {e}")
 
@@ -419,35 +670,59 @@ def main():
     # Direct read from search results
     if args.read and 1 <= args.read <= len(works):
         work = works[args.read - 1]
-        print(f"\n📖 Reading: {work['title']}")
-        reader.read_work(work['url'], args.chapter, use_pager=not args.no_pager)
+        print(f"\n📖 Reading: {work.title}")
+        reader.read_work(work.url, args.chapter, use_pager=not args.no_pager)
         return
     
     # Interactive mode
     if works:
         print(f"\n📚 Commands:")
         print(f"  1-{len(works)}: Read work")
+        print(f"  c: Next chapter of the last work read")
         print(f"  n: Next page")
         print(f"  q: Quit")
         
+        # Fetch the next page in the background while the user reads this one
+        next_page = _in_background(reader.fetch_search_page, args.query, args.sort, args.page + 1, args.rating)
+        
+        # Work last read and its next chapter, for the 'c' command
+        reading = None
+        
         while True:
             try:
                 choice = input("> ").strip().lower()
                 if choice == 'q':
                     break
                 elif choice == 'n':
-                    # Next page
-                    works = reader.search_fics(args.query, args.sort, args.page + 1, args.rating)
+                    # Next page, fetched again in the foreground if the prefetch failed
+                    try:
+                        works = next_page.result()
+                    except requests.RequestException:
+                        works = []
+                    if not works:
+                        works = reader.search_fics(args.query, args.sort, args.page + 1, args.rating)
                     args.page += 1
+                    next_page = _in_background(reader.fetch_search_page, args.query, args.sort, args.page + 1, args.rating)
                     reader.display_works(works)
                     print(f"\nPage {args.page} - Commands: 1-{len(works)} (read), n (next page), q (quit):")
+                elif choice == 'c':
+                    # Next chapter, usually already prefetched while the last one was shown
+                    if not reading:
+                        print("No next chapter to read.")
+                        continue
+                    work, next_chapter = reading
+                    print(f"\n📖 Reading: {work.title} (chapter {next_chapter})")
+                    next_chapter = reader.read_work(work.url, next_chapter, use_pager=not args.no_pager, prefetch_next=True)
+                    reading = (work, next_chapter) if next_chapter else None
+                    print(f"\nCommands: 1-{len(works)} (read), c (next chapter), n (next page), q (quit):")
                 else:
                     num = int(choice)
                     if 1 <= num <= len(works):
                         work = works[num - 1]
-                        print(f"\n📖 Reading: {work['title']}")
-                        reader.read_work(work['url'], args.chapter, use_pager=not args.no_pager)
-                        print(f"\nCommands: 1-{len(works)} (read), n (next page), q (quit):")
+                        print(f"\n📖 Reading: {work.title}")
+                        next_chapter = reader.read_work(work.url, args.chapter, use_pager=not args.no_pager, prefetch_next=True)
+                        reading = (work, next_chapter) if next_chapter else None
+                        print(f"\nCommands: 1-{len(works)} (read), c (next chapter), n (next page), q (quit):")
                     else:
                         print(f"Please enter a number between 1 and {len(works)}, 'n' for next page, or 'q' to quit.")
                         